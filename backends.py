@@ -0,0 +1,277 @@
+"""Interchangeable dataframe backends for the cleaning operations.
+
+Every backend takes and returns pandas frames through run_on_backend(), keeps
+the input's row labels, fills only columns whose type fits the fill value, and
+only fills columns that actually have gaps. One difference remains by design:
+the NumPy-backed pandas backend represents missing text as '' once the
+sanitizer has run, while the Arrow-backed backends keep real nulls.
+"""
+import pandas as pd
+import streamlit as st
+
+DEFAULT_BACKEND = "pandas"
+ROW_POSITION = "__row_position__"
+
+
+def string_columns(df):
+    """Return the text columns of a pandas frame, whatever their storage"""
+    return [
+        col for col, dtype in df.dtypes.items()
+        if pd.api.types.is_object_dtype(dtype) or (
+            pd.api.types.is_string_dtype(dtype)
+            and not isinstance(dtype, pd.CategoricalDtype)
+        )
+    ]
+
+
+def densify(df):
+    """Dense copies of sparse columns; Arrow and Polars cannot ingest pandas sparse arrays"""
+    sparse_cols = [col for col, dtype in df.dtypes.items() if isinstance(dtype, pd.SparseDtype)]
+    if not sparse_cols:
+        return df
+    result = df.copy(deep=False)
+    for col in sparse_cols:
+        result[col] = result[col].sparse.to_dense()
+    return result
+
+
+class PandasBackend:
+    """Plain pandas with NumPy-backed dtypes (the original behaviour)"""
+    name = "pandas"
+    label = "pandas (NumPy dtypes)"
+
+    @staticmethod
+    def is_available():
+        return True
+
+    def from_pandas(self, df):
+        return df
+
+    def to_pandas(self, frame, index=None):
+        return frame
+
+    def dropna(self, frame, axis=0, how='any', thresh=None):
+        if thresh is not None:
+            return frame.dropna(axis=axis, thresh=thresh)
+        return frame.dropna(axis=axis, how=how)
+
+    def fillna(self, frame, value):
+        # Text columns get the value as text; numeric columns only take numbers
+        result = frame.copy()
+        text_cols = set(string_columns(frame))
+        for col in result.columns:
+            if col in text_cols:
+                result[col] = result[col].fillna(str(value))
+            elif (not isinstance(value, str)
+                  and pd.api.types.is_numeric_dtype(result[col])
+                  and not pd.api.types.is_bool_dtype(result[col])):
+                result[col] = result[col].fillna(value)
+        return result
+
+    def fill_strategy(self, frame, strategy):
+        if strategy == 'ffill':
+            return frame.ffill()
+        if strategy == 'bfill':
+            return frame.bfill()
+        if strategy == 'mean':
+            numeric_cols = frame.select_dtypes(include='number').columns
+            return frame.fillna(frame[numeric_cols].mean())
+        return frame
+
+    def transform_strings(self, frame, operation):
+        result = frame.copy()
+        for col in string_columns(frame):
+            present = result[col].notna()
+            text = result[col].astype(str).str
+            # Mask missing values back out so None doesn't become the text 'none'
+            if operation == 'lower':
+                result[col] = text.lower().where(present)
+            elif operation == 'upper':
+                result[col] = text.upper().where(present)
+            elif operation == 'strip':
+                result[col] = text.strip().where(present)
+        return result
+
+    def string_features(self, frame, feature):
+        # Only the text columns, each reduced to one value per row
+        result = frame[string_columns(frame)].copy()
+        for col in result.columns:
+            present = result[col].notna()
+            text = result[col].astype(str).str
+            if feature == 'length':
+                result[col] = text.len().where(present)
+            elif feature == 'first_char':
+                result[col] = text[0].where(present)
+        return result
+
+    def duplicated_rows(self, frame):
+        return frame[frame.duplicated()]
+
+    def drop_duplicates(self, frame):
+        return frame.drop_duplicates()
+
+
+class PandasArrowBackend(PandasBackend):
+    """pandas with pyarrow-backed dtypes: native strings and nulls, zero-copy to Arrow"""
+    name = "pandas-arrow"
+    label = "pandas (Arrow dtypes)"
+
+    @staticmethod
+    def is_available():
+        try:
+            import pyarrow  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def from_pandas(self, df):
+        if all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes):
+            return df
+        df = densify(df)
+        # convert_integer=False keeps float columns float, so filling a mean
+        # into a whole-number float column cannot fail or truncate
+        return df.convert_dtypes(dtype_backend="pyarrow", convert_integer=False)
+
+    def transform_strings(self, frame, operation):
+        # Arrow string kernels keep nulls as nulls instead of the text 'nan'
+        result = frame.copy()
+        for col in string_columns(frame):
+            text = result[col].str
+            if operation == 'lower':
+                result[col] = text.lower()
+            elif operation == 'upper':
+                result[col] = text.upper()
+            elif operation == 'strip':
+                result[col] = text.strip()
+        return result
+
+    def string_features(self, frame, feature):
+        result = frame[string_columns(frame)].copy()
+        for col in result.columns:
+            if feature == 'length':
+                result[col] = result[col].str.len()
+            elif feature == 'first_char':
+                result[col] = result[col].str[0]
+        return result
+
+
+class PolarsBackend:
+    """Polars: multi-threaded, Arrow-native execution handed back as Arrow-backed pandas"""
+    name = "polars"
+    label = "Polars"
+
+    @staticmethod
+    def is_available():
+        try:
+            import polars  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def from_pandas(self, df):
+        import polars as pl
+        # Polars frames have no index, so carry row positions in a column
+        return pl.from_pandas(densify(df).reset_index(drop=True)).with_row_index(ROW_POSITION)
+
+    def to_pandas(self, frame, index=None):
+        positions = frame[ROW_POSITION].to_numpy() if ROW_POSITION in frame.columns else None
+        result = frame.drop(ROW_POSITION, strict=False).to_pandas(use_pyarrow_extension_array=True)
+        if index is not None and positions is not None:
+            result.index = index[positions]
+        return result
+
+    @staticmethod
+    def _data_columns(frame):
+        return [col for col in frame.columns if col != ROW_POSITION]
+
+    def dropna(self, frame, axis=0, how='any', thresh=None):
+        import polars as pl
+        data = pl.col(self._data_columns(frame))
+        if axis == 1:
+            return frame.select([col for col in frame.columns if frame[col].null_count() == 0])
+        if thresh is not None:
+            return frame.filter(pl.sum_horizontal(data.is_not_null()) >= thresh)
+        if how == 'all':
+            return frame.filter(~pl.all_horizontal(data.is_null()))
+        return frame.drop_nulls(subset=self._data_columns(frame))
+
+    def fillna(self, frame, value):
+        import polars.selectors as cs
+        if isinstance(value, str):
+            return frame.with_columns(cs.string().fill_null(value))
+        return frame.with_columns(
+            cs.numeric().fill_null(value),
+            cs.string().fill_null(str(value)),
+        )
+
+    def fill_strategy(self, frame, strategy):
+        import polars as pl
+        import polars.selectors as cs
+        if strategy == 'ffill':
+            return frame.fill_null(strategy='forward')
+        if strategy == 'bfill':
+            return frame.fill_null(strategy='backward')
+        if strategy == 'mean':
+            # Only touch columns with gaps, so complete int columns stay int
+            numeric_cols = [col for col in frame.select(cs.numeric()).columns if frame[col].null_count()]
+            return frame.with_columns(
+                [pl.col(col).fill_null(pl.col(col).mean()) for col in numeric_cols]
+            )
+        return frame
+
+    def transform_strings(self, frame, operation):
+        import polars.selectors as cs
+        text = cs.string()
+        if operation == 'lower':
+            return frame.with_columns(text.str.to_lowercase())
+        if operation == 'upper':
+            return frame.with_columns(text.str.to_uppercase())
+        if operation == 'strip':
+            return frame.with_columns(text.str.strip_chars())
+        return frame
+
+    def string_features(self, frame, feature):
+        import polars as pl
+        import polars.selectors as cs
+        text = cs.string()
+        if feature == 'length':
+            text = text.str.len_chars().cast(pl.Int64)
+        elif feature == 'first_char':
+            text = text.str.slice(0, 1)
+        return frame.select(pl.col(ROW_POSITION), text)
+
+    def duplicated_rows(self, frame):
+        import polars as pl
+        return frame.filter(~pl.struct(self._data_columns(frame)).is_first_distinct())
+
+    def drop_duplicates(self, frame):
+        return frame.unique(subset=self._data_columns(frame), keep='first', maintain_order=True)
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (PandasBackend, PandasArrowBackend, PolarsBackend)
+}
+
+
+def available_backends():
+    """Names of the backends whose libraries are installed"""
+    return [name for name, backend in BACKENDS.items() if backend.is_available()]
+
+
+def get_backend(name=None):
+    """Return the requested backend, defaulting to the one chosen in the session"""
+    if name is None:
+        name = st.session_state.get("backend", DEFAULT_BACKEND)
+    backend = BACKENDS.get(name, BACKENDS[DEFAULT_BACKEND])
+    if not backend.is_available():
+        backend = BACKENDS[DEFAULT_BACKEND]
+    return backend()
+
+
+def run_on_backend(df, operation, *args, backend=None, **kwargs):
+    """Apply a backend method to a pandas frame and hand back a pandas frame"""
+    backend = backend or get_backend()
+    frame = backend.from_pandas(df)
+    result = getattr(backend, operation)(frame, *args, **kwargs)
+    return backend.to_pandas(result, index=df.index)
@@ -0,0 +1,82 @@
+"""Compare dataframe backends on typical cleaning chains.
+
+Usage: python benchmarks/bench_backends.py --rows 1000000 --repeat 3
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backends import BACKENDS  # noqa: E402
+
+CHAINS = {
+    "text cleanup": [
+        ('fillna', ("Unknown",), {}),
+        ('transform_strings', ('strip',), {}),
+        ('transform_strings', ('lower',), {}),
+        ('drop_duplicates', (), {}),
+    ],
+    "missing values": [
+        ('dropna', (), {'how': 'all'}),
+        ('fill_strategy', ('mean',), {}),
+        ('fillna', (0,), {}),
+    ],
+    "dedupe + drop": [
+        ('drop_duplicates', (), {}),
+        ('dropna', (), {'thresh': 3}),
+    ],
+}
+
+
+def make_dataset(rows, seed=0):
+    """Synthetic frame shaped like a typical uploaded CSV"""
+    rng = np.random.default_rng(seed)
+    cities = np.array([" Paris", "berlin ", "LONDON", "Madrid", None], dtype=object)
+    df = pd.DataFrame({
+        "id": np.arange(rows),
+        "amount": rng.normal(100, 25, rows),
+        "quantity": rng.integers(0, 50, rows).astype(float),
+        "city": cities[rng.integers(0, len(cities), rows)],
+        "segment": rng.choice(np.array(["a", "b", "c"], dtype=object), rows),
+    })
+    df.loc[rng.random(rows) < 0.05, "amount"] = np.nan
+    df.loc[rng.random(rows) < 0.05, "quantity"] = np.nan
+    return df
+
+
+def run_chain(backend, df, steps):
+    frame = backend.from_pandas(df)
+    for method, args, kwargs in steps:
+        frame = getattr(backend, method)(frame, *args, **kwargs)
+    return backend.to_pandas(frame)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_dataset(args.rows)
+    print(f"{'backend':<16}{'chain':<18}{'best (s)':>10}{'mean (s)':>10}")
+    for name, backend_cls in BACKENDS.items():
+        if not backend_cls.is_available():
+            print(f"{name:<16}{'(not installed)':<18}")
+            continue
+        backend = backend_cls()
+        for chain_name, steps in CHAINS.items():
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                run_chain(backend, df, steps)
+                timings.append(time.perf_counter() - start)
+            print(f"{name:<16}{chain_name:<18}{min(timings):>10.3f}{sum(timings) / len(timings):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
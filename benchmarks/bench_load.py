@@ -0,0 +1,234 @@
+"""Drive the app headlessly across simulated sessions and report rerun latency.
+
+Each session loads a synthetic dataset, clicks through every cleaning and
+transformation operation, generates each chart type and opens the export page,
+timing every rerun. Peak memory comes from the resource module on Unix and
+from psutil, if installed, on Windows.
+
+Usage:
+    python benchmarks/bench_load.py --sessions 4 --rows 50000 --cols 8
+    python benchmarks/bench_load.py --save-baseline benchmarks/baseline.json
+    python benchmarks/bench_load.py --baseline benchmarks/baseline.json --tolerance 0.2
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ingest import infer_schema  # noqa: E402
+from operations import CLEANING_OPS, TRANSFORM_OPS, OP_MAP  # noqa: E402
+
+CHART_TYPES = [
+    "Line", "Bar", "Histogram", "Box", "Scatter", "Pie",
+    "Heatmap", "Area", "Violin", "Strip", "Sunburst", "Treemap", "Funnel"
+]
+# Compared against the baseline; higher is worse for all but throughput
+METRICS = ["p50_ms", "p95_ms", "p99_ms", "max_rss_mb", "reruns_per_s"]
+
+
+def make_dataset(rows, cols, seed=0):
+    """Synthetic mixed-type frame: numeric, text, categorical, dates, gaps"""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(cols):
+        kind = i % 4
+        if kind == 0:
+            data[f"num_{i}"] = rng.normal(100, 20, rows)
+        elif kind == 1:
+            data[f"int_{i}"] = rng.integers(0, 1000, rows)
+        elif kind == 2:
+            data[f"cat_{i}"] = rng.choice(np.array(["North", "South", " East", "west "], dtype=object), rows)
+        else:
+            data[f"date_{i}"] = (pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365 * 24, rows), unit="h")).astype(str)
+    df = pd.DataFrame(data)
+    df.iloc[rng.random(rows) < 0.02, 0] = np.nan
+    return infer_schema(df)
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MiB, or None where it can't be read"""
+    try:
+        import resource
+    except ImportError:
+        # Windows has no resource module; psutil reports the peak working set there
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return psutil.Process().memory_info().peak_wset / 2 ** 20
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and KiB on Linux
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def _try_set(at, widget, key, value):
+    """Set a widget if the current page renders it"""
+    try:
+        getattr(at, widget)(key=key).set_value(value)
+        return True
+    except KeyError:
+        return False
+
+
+class Session:
+    """One simulated analyst, timing every rerun of the app"""
+
+    def __init__(self, df, timeout):
+        from streamlit.testing.v1 import AppTest
+        self.at = AppTest.from_file(os.path.join(ROOT, "main.py"), default_timeout=timeout)
+        self.df = df
+        self.latencies = []
+        self.errors = 0
+
+    def rerun(self, step, action=None):
+        start = time.perf_counter()
+        if action is None:
+            self.at.run()
+        else:
+            action()
+        self.latencies.append((step, time.perf_counter() - start))
+        self.errors += len(self.at.exception) + len(self.at.error)
+
+    def goto(self, page):
+        self.at.session_state["page"] = page
+        self.at.session_state["df"] = self.df
+        self.rerun(f"page:{page}")
+
+    def run_operations(self, menu_page, key_prefix, groups):
+        for group in groups:
+            for label in OP_MAP[group]:
+                self.goto(menu_page)
+                self.rerun(f"open:{group}", self.at.button(key=f"{key_prefix}_{group}").click().run)
+                self.at.session_state["df"] = self.df
+                self.rerun(f"op:{label}", self.at.button(key=f"op_{label}").click().run)
+
+    def run_charts(self):
+        numeric = self.df.select_dtypes(include=[np.number]).columns
+        text = self.df.select_dtypes(exclude=[np.number]).columns
+        self.goto("visualize")
+        for chart_type in CHART_TYPES:
+            chart_select = next(s for s in self.at.selectbox if s.label == "Select Chart Type")
+            self.rerun(f"select:{chart_type}", chart_select.set_value(chart_type).run)
+            if len(numeric) and len(text):
+                for key in ("x_box", "pie_names", "funnel_y"):
+                    _try_set(self.at, "selectbox", key, text[0])
+                for key in ("y_basic", "y_box", "pie_values", "values_hier", "funnel_x", "x_hist"):
+                    _try_set(self.at, "selectbox", key, numeric[0])
+                _try_set(self.at, "multiselect", "path_hier", [text[0]])
+            self.rerun(f"chart:{chart_type}", self.at.button(key="generate_chart").click().run)
+
+    def run(self):
+        self.at.session_state["df"] = self.df
+        self.rerun("start")
+        self.run_operations("cleaning_menu", "clean", CLEANING_OPS)
+        self.run_operations("transform_menu", "trans", TRANSFORM_OPS)
+        self.run_charts()
+        self.goto("export")
+
+
+def run_session(rows, cols, seed, timeout):
+    """Run one session end to end; safe to call in a worker process or thread"""
+    df = make_dataset(rows, cols, seed)
+    session = Session(df, timeout)
+    start = time.perf_counter()
+    session.run()
+    wall = time.perf_counter() - start
+    return {
+        "latencies": [seconds for _, seconds in session.latencies],
+        "slowest": sorted(session.latencies, key=lambda item: item[1])[-5:],
+        "errors": session.errors,
+        "wall_s": wall,
+        # In thread mode this covers the whole process, not just this session
+        "max_rss_mb": peak_rss_mb(),
+    }
+
+
+def summarize(results, wall):
+    latencies = np.array([s for result in results for s in result["latencies"]]) * 1000
+    rss = [result["max_rss_mb"] for result in results if result["max_rss_mb"] is not None]
+    return {
+        "sessions": len(results),
+        "reruns": int(latencies.size),
+        "errors": sum(result["errors"] for result in results),
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p95_ms": float(np.percentile(latencies, 95)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+        "max_rss_mb": max(rss) if rss else None,
+        "reruns_per_s": latencies.size / wall,
+    }
+
+
+def compare(summary, baseline, tolerance):
+    """Metrics that regressed by more than tolerance against the baseline"""
+    regressions = []
+    # Failing operations make reruns cheaper, so errors must gate on their own
+    if summary["errors"] > baseline.get("errors", 0):
+        regressions.append(f"errors: {baseline.get('errors', 0)} -> {summary['errors']}")
+    for metric in METRICS:
+        old, new = baseline.get(metric), summary[metric]
+        if not old or new is None:
+            continue
+        change = (old - new) / old if metric == "reruns_per_s" else (new - old) / old
+        if change > tolerance:
+            regressions.append(f"{metric}: {old:.1f} -> {new:.1f} ({change:+.0%} worse)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--cols", type=int, default=8)
+    parser.add_argument("--mode", choices=["processes", "threads"], default="processes",
+                        help="processes isolate per-session RSS; threads share one server process")
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--baseline", help="JSON summary to compare against")
+    parser.add_argument("--save-baseline", help="write this run's summary as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    executor_cls = ProcessPoolExecutor if args.mode == "processes" else ThreadPoolExecutor
+    start = time.perf_counter()
+    with executor_cls(max_workers=args.sessions) as executor:
+        futures = [
+            executor.submit(run_session, args.rows, args.cols, seed, args.timeout)
+            for seed in range(args.sessions)
+        ]
+        results = [future.result() for future in futures]
+    wall = time.perf_counter() - start
+
+    summary = summarize(results, wall)
+    summary.update({"rows": args.rows, "cols": args.cols, "mode": args.mode})
+    print(json.dumps(summary, indent=2))
+    for i, result in enumerate(results):
+        reruns = len(result['latencies'])
+        rss = "unknown" if result['max_rss_mb'] is None else f"{result['max_rss_mb']:.0f} MB"
+        print(f"session {i}: {reruns} reruns in {result['wall_s']:.1f}s ({reruns / result['wall_s']:.1f}/s), "
+              f"{rss} RSS, {result['errors']} errors")
+        for step, seconds in reversed(result["slowest"]):
+            print(f"    {seconds * 1000:8.1f} ms  {step}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(summary, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(summary, json.load(f), args.tolerance)
+        if regressions:
+            print("Regressions against baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("No regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
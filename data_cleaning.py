@@ -2,6 +2,9 @@ import streamlit as st
 from utils import back_button, next_button, nav
 from operations import CLEANING_OPS, OP_MAP
 
+# Groups whose fitted parameters are shown below the operations, never saved as the dataset
+FITTED_GROUPS = ("Feature Scaling", "Encoding Categorical Variables")
+
 def cleaning_menu():
     back_button("upload")
     st.title("Data Cleaning")
@@ -42,4 +45,10 @@ def operation_page():
                     if df_result.shape != df.shape:
                         st.info(f"Data shape changed: {df.shape} → {df_result.shape}")
             except Exception as e:
-                st.error(f" Error applying operation: {str(e)}")
\ No newline at end of file
+                st.error(f" Error applying operation: {str(e)}")
+    if op_group == "Column Operations":
+        from data_transformation import derived_columns_section
+        derived_columns_section(df)
+    if op_group in FITTED_GROUPS:
+        from data_transformation import fitted_parameters_section
+        fitted_parameters_section(op_group)
\ No newline at end of file
@@ -16,4 +16,63 @@ def transform_menu():
                         st.session_state.operation_set = btn
                         nav("operation")
     st.markdown("---")
-    next_button("Next: Data Visualization", "visualize")
\ No newline at end of file
+    next_button("Next: Data Visualization", "visualize")
+
+def derived_columns_section(df):
+    """Add computed columns from typed expressions, and replay saved ones"""
+    from expressions import apply_expressions
+    from utils import enhanced_sanitize_dataframe_for_streamlit, safe_display_dataframe
+    st.markdown("---")
+    st.subheader("Derived Columns")
+    st.caption(
+        "One 'new_column = expression' per line. Wrap column names containing spaces in backticks. "
+        "Supports arithmetic, comparisons, and/or/not, where(cond, a, b), 'a if cond else b', "
+        "abs/sqrt/log/exp, and the .str (len, lower, upper, strip, contains, slice, ...) "
+        "and .dt (year, month, day, hour, weekday, ...) accessors."
+    )
+    text = st.text_area("Expressions", key="derived_expressions", height=120)
+    col1, col2 = st.columns(2)
+    with col1:
+        add_clicked = st.button("Add Derived Columns", key="derived_add", disabled=not text.strip())
+    with col2:
+        save_clicked = st.button("Save as Step", key="derived_save", disabled=not text.strip())
+    steps = st.session_state.derived_steps
+    if save_clicked and text.strip() not in steps:
+        steps.append(text.strip())
+        st.success("Expressions saved as a reusable step.")
+    replay_clicked = False
+    if steps:
+        with st.expander(f"Saved Steps ({len(steps)})"):
+            for step in steps:
+                st.code(step)
+            replay_clicked = st.button("Apply Saved Steps", key="derived_replay")
+    if add_clicked or replay_clicked:
+        try:
+            with st.spinner("Computing derived columns..."):
+                df_result = df
+                for block in (steps if replay_clicked else [text]):
+                    df_result = apply_expressions(df_result, block)
+                df_result = enhanced_sanitize_dataframe_for_streamlit(df_result)
+                st.session_state.df = df_result
+                st.success(" Derived columns added successfully!")
+                st.subheader("Updated Data Preview")
+                safe_display_dataframe(df_result.head())
+        except Exception as e:
+            st.error(f" Error computing derived columns: {str(e)}")
+
+def fitted_parameters_section(op_group):
+    """Show the parameters fitted so far, without replacing the dataset"""
+    from encoding import mapping_summary
+    from scaling import scaler_summary
+    from utils import safe_display_dataframe
+    st.markdown("---")
+    if op_group == "Feature Scaling":
+        st.subheader("Fitted Scaling")
+        summary = scaler_summary(st.session_state.get("scalers") or {})
+    else:
+        st.subheader("Fitted Encoders")
+        summary = mapping_summary(st.session_state.get("encoders") or {})
+    if summary.empty:
+        st.info("Nothing fitted yet; the next run will fit on the current data.")
+    else:
+        safe_display_dataframe(summary)
@@ -2,6 +2,8 @@ import streamlit as st
 from utils import back_button, next_button, safe_display_dataframe
 import plotly.express as px
 import numpy as np
+import pandas as pd
+from datetime_features import FREQUENCIES, resample_frame
 
 def visualization_page():
     back_button("transform_menu")
@@ -48,6 +50,15 @@ def visualization_page():
             params['x'] = st.selectbox("Values", df.columns, key="funnel_x")
             params['y'] = st.selectbox("Categories", df.columns, key="funnel_y")
         
+        # Time-series charts can be drawn on bucketed data instead of raw timestamps
+        if chart_type in ["Line", "Bar", "Area", "Scatter"] and pd.api.types.is_datetime64_any_dtype(df[params['x']]):
+            time_bucket = st.selectbox("Time bucket (optional)", [None] + list(FREQUENCIES), key="time_bucket")
+            if time_bucket:
+                params['time_bucket'] = time_bucket
+                # Only counting makes sense for a text y-axis
+                aggs = TIME_AGGS if pd.api.types.is_numeric_dtype(df[params['y']]) else ['count']
+                params['time_agg'] = st.selectbox("Aggregation", aggs, key="time_agg")
+        
         # Additional mappings
         st.subheader("Additional Mappings")
         
@@ -219,11 +230,31 @@ def visualization_page():
     
     next_button("Next", "export")
 
+# Aggregations offered when a chart is bucketed by time
+TIME_AGGS = ['mean', 'sum', 'count', 'min', 'max']
+# Column mappings kept as group keys when a chart is bucketed by time
+TIME_BUCKET_GROUPS = ('color', 'symbol', 'facet_col', 'facet_row', 'line_group', 'animation_frame', 'animation_group')
+
 def create_chart(df, chart_type, params):
     """Create chart based on type and parameters"""
 
     clean_params = {k: v for k, v in params.items() if v is not None and v != ""}
     
+    time_bucket = clean_params.pop('time_bucket', None)
+    time_agg = clean_params.pop('time_agg', 'mean')
+    if time_bucket and 'x' in clean_params:
+        # Per-row error bars don't survive aggregation into buckets
+        dropped = [k for k in ('error_x', 'error_y') if clean_params.pop(k, None)]
+        if dropped:
+            st.info(f"{', '.join(dropped)} ignored: error bars can't be bucketed by time.")
+        by = list(dict.fromkeys(clean_params[k] for k in TIME_BUCKET_GROUPS if k in clean_params))
+        value_cols = list(dict.fromkeys(clean_params[k] for k in ('y', 'size') if k in clean_params)) or None
+        if time_agg != 'count' and value_cols and not all(
+                pd.api.types.is_numeric_dtype(df[col]) for col in value_cols if col not in by):
+            st.info(f"Counting values per {time_bucket.lower()}: '{time_agg}' needs numeric columns.")
+            time_agg = 'count'
+        df = resample_frame(df, clean_params['x'], FREQUENCIES[time_bucket], time_agg, by=by, value_cols=value_cols)
+    
     if chart_type == "Line":
         return px.line(df, **clean_params)
     elif chart_type == "Bar":
@@ -0,0 +1,119 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from backends import string_columns
+
+CANDIDATE_FORMATS = [
+    "%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M",
+    "%Y/%m/%d", "%d/%m/%Y", "%m/%d/%Y", "%d-%m-%Y", "%d.%m.%Y",
+    "%d/%m/%Y %H:%M", "%m/%d/%Y %H:%M", "%d %b %Y", "%b %d, %Y", "%Y%m%d",
+]
+FREQUENCIES = {"Hour": "h", "Day": "D", "Week": "W", "Month": "MS", "Quarter": "QS", "Year": "YS"}
+SAMPLE_SIZE = 50
+MIN_PARSED_RATIO = 0.9
+
+# feature -> (compact dtype, extractor over a DatetimeIndex)
+COMPONENTS = {
+    "year": ("int16", lambda idx: idx.year),
+    "month": ("int8", lambda idx: idx.month),
+    "day": ("int8", lambda idx: idx.day),
+    "weekday": ("int8", lambda idx: idx.weekday),
+    "hour": ("int8", lambda idx: idx.hour),
+    "quarter": ("int8", lambda idx: idx.quarter),
+}
+
+
+@lru_cache(maxsize=512)
+def detect_format(sample):
+    """First candidate format that parses every value of a sample (cached per sample)"""
+    for fmt in CANDIDATE_FORMATS:
+        try:
+            pd.to_datetime(pd.Series(sample), format=fmt, errors="raise")
+            return fmt
+        except (ValueError, TypeError):
+            continue
+    return None
+
+
+def parse_datetime_column(series, min_ratio=MIN_PARSED_RATIO):
+    """Parse a text column with a detected format; None if it isn't really dates"""
+    present = series.dropna()
+    # The sanitizer turns missing text into '', so count that as missing too
+    present = present[present.astype(str).str.strip() != ""]
+    if present.empty:
+        return None
+    sample = tuple(present.astype(str).unique()[:SAMPLE_SIZE])
+    fmt = detect_format(sample)
+    if fmt is None:
+        # Plain numbers are not dates, however pandas might read them
+        if all(value.strip().lstrip("-").replace(".", "", 1).isdigit() for value in sample):
+            return None
+        parsed = pd.to_datetime(series, errors="coerce")
+    else:
+        parsed = pd.to_datetime(series, format=fmt, errors="coerce")
+    if parsed.notna().sum() < min_ratio * len(present):
+        return None
+    return parsed
+
+
+def parse_dates(df):
+    """Convert every date-like text column in place of the original, keeping all others"""
+    result = df.copy(deep=False)
+    for col in string_columns(df):
+        try:
+            parsed = parse_datetime_column(df[col])
+        except (ValueError, TypeError, OverflowError):
+            continue
+        if parsed is not None:
+            result[col] = parsed
+    return result
+
+
+def datetime_columns(df):
+    return [col for col, dtype in df.dtypes.items() if pd.api.types.is_datetime64_any_dtype(dtype)]
+
+
+def extract_components(df, columns=None, features=tuple(COMPONENTS)):
+    """Append compact calendar features, epoch seconds and a month bucket per datetime column"""
+    columns = datetime_columns(df) if columns is None else columns
+    new_columns = {}
+    for col in columns:
+        idx = pd.DatetimeIndex(df[col])
+        instants = idx
+        if idx.tz is not None:
+            # Epoch seconds count from the UTC instant; calendar features use local time
+            instants = idx.tz_convert("UTC").tz_localize(None)
+            idx = idx.tz_localize(None)
+        has_missing = bool(idx.isna().any())
+        for feature in features:
+            dtype, extract = COMPONENTS[feature]
+            values = np.asarray(extract(idx))
+            # Small ints cannot hold NaN; fall back to float32, still half of float64
+            new_columns[f"{col}_{feature}"] = values.astype("float32" if has_missing else dtype)
+        # Timedelta arithmetic is independent of the index resolution (ns/us/s)
+        epoch = np.asarray((instants - pd.Timestamp(0)) // pd.Timedelta(seconds=1))
+        new_columns[f"{col}_epoch"] = epoch.astype("float64" if has_missing else "int64")
+        new_columns[f"{col}_month_start"] = idx.to_period("M").to_timestamp()
+    if not new_columns:
+        return df
+    return pd.concat([df, pd.DataFrame(new_columns, index=df.index)], axis=1)
+
+
+def resample_frame(df, time_col, freq, agg="mean", by=None, value_cols=None):
+    """Aggregate value columns into time buckets, optionally per group"""
+    by = [col for col in (by or []) if col != time_col]
+    if value_cols is None:
+        value_cols = [col for col in df.select_dtypes(include=[np.number]).columns if col not in by]
+    value_cols = [col for col in dict.fromkeys(value_cols) if col != time_col and col not in by]
+    frame = df[[time_col] + by + value_cols]
+    if not pd.api.types.is_datetime64_any_dtype(frame[time_col]):
+        parsed = parse_datetime_column(frame[time_col])
+        if parsed is None:
+            raise ValueError(f"Column '{time_col}' does not contain dates")
+        frame = frame.assign(**{time_col: parsed})
+    grouped = frame.groupby([pd.Grouper(key=time_col, freq=freq)] + by, observed=True)
+    if agg == "count":
+        return grouped[value_cols].count().reset_index() if value_cols else grouped.size().reset_index(name="count")
+    return grouped[value_cols].agg(agg).reset_index()
@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+
+OTHER_LABEL = "__other__"
+MAX_CATEGORIES = 50      # one-hot columns kept per source column before rare values are pooled
+HASH_THRESHOLD = 1000    # above this many distinct values, hash into buckets instead
+DENSE_LIMIT = 32         # more indicators than this per column are stored sparse
+
+
+def fit_category_mapping(series, max_categories=MAX_CATEGORIES, hash_threshold=HASH_THRESHOLD):
+    """Decide how a column will be encoded by looking at its cardinality first"""
+    if isinstance(series.dtype, pd.CategoricalDtype) and max_categories is None:
+        return {"categories": series.cat.categories.tolist(), "other": False, "hash_buckets": None}
+    counts = series.value_counts(dropna=True)
+    if max_categories is None:
+        return {"categories": sorted(counts.index.tolist(), key=str), "other": False, "hash_buckets": None}
+    if len(counts) > hash_threshold:
+        return {"categories": [], "other": False, "hash_buckets": max_categories}
+    kept = counts.index[:max_categories].tolist()
+    return {"categories": kept, "other": len(counts) > len(kept), "hash_buckets": None}
+
+
+def _code_dtype(n_codes):
+    """Smallest signed integer type holding codes 0..n_codes-1 and -1 for missing"""
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_codes <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def category_codes(series, mapping):
+    """Integer codes for a column under a fitted mapping (-1 for missing)"""
+    n_categories = len(mapping["categories"])
+    if mapping["hash_buckets"]:
+        hashed = pd.util.hash_pandas_object(series.astype(str), index=False).to_numpy()
+        codes = (hashed % np.uint64(mapping["hash_buckets"])).astype(np.int32)
+        codes[series.isna().to_numpy()] = -1
+        return codes
+    if (isinstance(series.dtype, pd.CategoricalDtype)
+            and series.cat.categories.tolist() == mapping["categories"]):
+        # Already coded against the same categories: reuse, don't re-factorize
+        codes = series.cat.codes.to_numpy()
+    else:
+        # Values outside the fitted categories (and missing values) get -1
+        codes = pd.Index(mapping["categories"]).get_indexer(series).astype(_code_dtype(n_categories + 1))
+    if mapping["other"]:
+        # Codes are sized for n_categories, so the extra bucket always fits; copy
+        # because category codes may be a view of the source column
+        codes = codes.copy()
+        codes[(codes == -1) & series.notna().to_numpy()] = n_categories
+    return codes
+
+
+def indicator_labels(col, mapping):
+    """Column names of the indicator block for one source column"""
+    if mapping["hash_buckets"]:
+        return [f"{col}_bucket{i}" for i in range(mapping["hash_buckets"])]
+    labels = [f"{col}_{cat}" for cat in mapping["categories"]]
+    if mapping["other"]:
+        labels.append(f"{col}_{OTHER_LABEL}")
+    return labels
+
+
+def indicator_block(codes, labels, index):
+    """Bool indicators from codes; sparse once the block gets wide"""
+    width = len(labels)
+    if width <= DENSE_LIMIT:
+        return pd.DataFrame(codes[:, None] == np.arange(width), index=index, columns=labels)
+    from scipy import sparse
+    rows = np.flatnonzero(codes >= 0)
+    matrix = sparse.csc_matrix(
+        (np.ones(len(rows), dtype=np.int8), (rows, codes[rows])),
+        shape=(len(codes), width),
+    )
+    # from_spmatrix keeps 0 as the fill value; bool blocks need False instead
+    block = pd.DataFrame.sparse.from_spmatrix(matrix, index=index, columns=labels)
+    return block.astype(pd.SparseDtype(bool, False))
+
+
+def one_hot_encode(df, columns, mappings):
+    """Replace each column with its indicators, keeping every other column as-is"""
+    blocks = [df.drop(columns=columns)]
+    for col in columns:
+        codes = category_codes(df[col], mappings[col])
+        blocks.append(indicator_block(codes, indicator_labels(col, mappings[col]), df.index))
+    return pd.concat(blocks, axis=1)
+
+
+def label_encode(df, columns, mappings):
+    """Compact integer codes for each column"""
+    return pd.DataFrame(
+        {col: category_codes(df[col], mappings[col]) for col in columns},
+        index=df.index,
+    )
+
+
+def fitted_mappings(df, columns, saved, max_categories=MAX_CATEGORIES):
+    """Reuse saved mappings and fit only the columns seen for the first time"""
+    mappings = dict(saved)
+    for col in columns:
+        if col not in mappings:
+            mappings[col] = fit_category_mapping(df[col], max_categories=max_categories)
+    return mappings
+
+
+def mapping_summary(encoders):
+    """One row per fitted encoder, for display"""
+    rows = []
+    for kind, mappings in encoders.items():
+        for col, mapping in mappings.items():
+            rows.append({
+                "Encoding": kind,
+                "Column": col,
+                "Categories": len(mapping["categories"]),
+                "Other Bucket": mapping["other"],
+                "Hash Buckets": mapping["hash_buckets"] or 0,
+            })
+    return pd.DataFrame(rows, columns=["Encoding", "Column", "Categories", "Other Bucket", "Hash Buckets"])
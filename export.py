@@ -1,5 +1,5 @@
 import streamlit as st
-from utils import back_button, safe_display_dataframe, safe_excel_export
+from utils import back_button, safe_display_dataframe, safe_excel_export, fitted_params_json, FITTED_STATE_KEYS
 
 def export_page():
     back_button("visualize")
@@ -45,4 +45,12 @@ def export_page():
                 mime="text/csv"
             )
             if "not available" in button_label:
-                st.warning(" Install openpyxl for Excel export: `pip install openpyxl`")
\ No newline at end of file
+                st.warning(" Install openpyxl for Excel export: `pip install openpyxl`")
+    if any(st.session_state.get(key) for key in FITTED_STATE_KEYS):
+        st.subheader("Fitted Parameters")
+        st.download_button(
+            label="Download fitted parameters (JSON)",
+            data=fitted_params_json(),
+            file_name="fitted_parameters.json",
+            mime="application/json"
+        )
\ No newline at end of file
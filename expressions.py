@@ -0,0 +1,352 @@
+import ast
+import copy
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+DerivedColumn = namedtuple("DerivedColumn", ["name", "source", "tree", "columns", "numexpr_source", "dtype"])
+
+FUNCTIONS = {
+    "where": np.where,
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "log": np.log,
+    "log10": np.log10,
+    "exp": np.exp,
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+}
+STR_METHODS = {"len", "lower", "upper", "strip", "contains", "startswith", "endswith", "slice"}
+DT_FIELDS = {"year", "month", "day", "hour", "minute", "weekday", "dayofyear", "quarter"}
+
+_BINOPS = {
+    ast.Add: lambda a, b: a + b,
+    ast.Sub: lambda a, b: a - b,
+    ast.Mult: lambda a, b: a * b,
+    ast.Div: lambda a, b: a / b,
+    ast.FloorDiv: lambda a, b: a // b,
+    ast.Mod: lambda a, b: a % b,
+    ast.Pow: lambda a, b: a ** b,
+    ast.BitAnd: lambda a, b: a & b,
+    ast.BitOr: lambda a, b: a | b,
+}
+_COMPARE = {
+    ast.Lt: lambda a, b: a < b,
+    ast.LtE: lambda a, b: a <= b,
+    ast.Gt: lambda a, b: a > b,
+    ast.GtE: lambda a, b: a >= b,
+    ast.Eq: lambda a, b: a == b,
+    ast.NotEq: lambda a, b: a != b,
+}
+# numexpr has no floor division, and its integer modulo by zero gives 0 where
+# pandas gives NaN; everything else above maps straight across
+_NUMEXPR_OPS = tuple(op for op in _BINOPS if op not in (ast.FloorDiv, ast.Mod)) + tuple(_COMPARE)
+
+_BACKTICK = re.compile(r"`([^`]+)`")
+
+
+def _quote_backticks(line):
+    """Swap `quoted column names` for identifiers, like DataFrame.eval does"""
+    aliases = {}
+
+    def replace(match):
+        alias = f"__col_{len(aliases)}"
+        aliases[alias] = match.group(1)
+        return alias
+
+    return _BACKTICK.sub(replace, line), aliases
+
+
+@lru_cache(maxsize=256)
+def _parse_line(line):
+    """Parse one 'name = expression' line; cached so each text is parsed once"""
+    code, aliases = _quote_backticks(line)
+    try:
+        module = ast.parse(code.strip(), mode="exec")
+    except SyntaxError as e:
+        raise ValueError(f"Could not parse '{line}': {e.msg}")
+    if len(module.body) != 1 or not isinstance(module.body[0], ast.Assign):
+        raise ValueError(f"Expected 'new_column = expression', got '{line}'")
+    assign = module.body[0]
+    if len(assign.targets) != 1 or not isinstance(assign.targets[0], ast.Name):
+        raise ValueError(f"Expected a single column name on the left of '{line}'")
+    target = assign.targets[0].id
+    return aliases.get(target, target), assign.value, aliases
+
+
+def _validate(node, aliases, dtypes, line):
+    """Check every node against the allowed grammar and the frame's schema"""
+    referenced = set()
+
+    def column_of(name_node):
+        name = aliases.get(name_node.id, name_node.id)
+        if name not in dtypes:
+            raise ValueError(f"Unknown column '{name}' in '{line}'")
+        referenced.add(name)
+        return name
+
+    def visit(n):
+        if isinstance(n, ast.Constant):
+            if not isinstance(n.value, (int, float, str, bool)):
+                raise ValueError(f"Unsupported literal in '{line}'")
+        elif isinstance(n, ast.Name):
+            column_of(n)
+        elif isinstance(n, ast.BinOp):
+            if type(n.op) not in _BINOPS:
+                raise ValueError(f"Unsupported operator in '{line}'")
+            visit(n.left)
+            visit(n.right)
+        elif isinstance(n, ast.UnaryOp):
+            if not isinstance(n.op, (ast.USub, ast.UAdd, ast.Not, ast.Invert)):
+                raise ValueError(f"Unsupported operator in '{line}'")
+            visit(n.operand)
+            if isinstance(n.op, ast.Not):
+                _check_boolean(n.operand, "not")
+        elif isinstance(n, ast.Compare):
+            if any(type(op) not in _COMPARE for op in n.ops):
+                raise ValueError(f"Unsupported comparison in '{line}'")
+            visit(n.left)
+            for comparator in n.comparators:
+                visit(comparator)
+        elif isinstance(n, ast.BoolOp):
+            for value in n.values:
+                visit(value)
+                _check_boolean(value, "and" if isinstance(n.op, ast.And) else "or")
+        elif isinstance(n, ast.IfExp):
+            visit(n.test)
+            visit(n.body)
+            visit(n.orelse)
+        elif isinstance(n, ast.Call):
+            if n.keywords:
+                raise ValueError(f"Keyword arguments are not supported in '{line}'")
+            func = n.func
+            if isinstance(func, ast.Name):
+                if func.id not in FUNCTIONS:
+                    raise ValueError(f"Unknown function '{func.id}' in '{line}'")
+            elif _accessor(func, "str", STR_METHODS):
+                _check_accessor(func.value.value, "str", line)
+            else:
+                raise ValueError(f"Unsupported call in '{line}'")
+            for arg in n.args:
+                visit(arg)
+        elif _accessor(n, "dt", DT_FIELDS):
+            _check_accessor(n.value.value, "dt", line)
+        else:
+            raise ValueError(f"Unsupported syntax '{ast.unparse(n)}' in '{line}'")
+
+    def _check_accessor(base, kind, line):
+        visit(base)
+        dtype = _probe_dtype(base, aliases, dtypes, line)
+        if kind == "str" and not pd.api.types.is_string_dtype(dtype):
+            raise ValueError(f"'.str' needs a text column in '{line}'")
+        if kind == "dt" and not pd.api.types.is_datetime64_any_dtype(dtype):
+            raise ValueError(f"'.dt' needs a datetime column in '{line}'")
+
+    def _check_boolean(operand, keyword):
+        # Evaluated element-wise as &, | and ~, which are bitwise on numbers
+        if not pd.api.types.is_bool_dtype(_probe_dtype(operand, aliases, dtypes, line)):
+            raise ValueError(
+                f"'{keyword}' needs true/false values, compare first (e.g. 'x != 0') in '{line}'"
+            )
+
+    visit(node)
+    return referenced
+
+
+def _accessor(node, kind, members):
+    """True for nodes shaped like <expr>.<kind>.<member>"""
+    return (
+        isinstance(node, ast.Attribute)
+        and node.attr in members
+        and isinstance(node.value, ast.Attribute)
+        and node.value.attr == kind
+    )
+
+
+def _numexpr_source(node, columns, dtypes):
+    """numexpr source for purely numeric expressions, or None"""
+    if numexpr is None:
+        return None
+    if not all(pd.api.types.is_numeric_dtype(dtypes[col]) or pd.api.types.is_bool_dtype(dtypes[col])
+               for col in columns):
+        return None
+    for n in ast.walk(node):
+        if isinstance(n, ast.Attribute) or (
+            isinstance(n, ast.Constant) and isinstance(n.value, str)
+        ):
+            return None
+        if isinstance(n, (ast.BinOp, ast.Compare)):
+            ops = [n.op] if isinstance(n, ast.BinOp) else n.ops
+            if any(not isinstance(op, _NUMEXPR_OPS) for op in ops):
+                return None
+            if isinstance(n, ast.Compare) and len(n.ops) > 1:
+                return None
+
+    class ToNumexpr(ast.NodeTransformer):
+        def visit_BoolOp(self, n):
+            self.generic_visit(n)
+            op = ast.BitAnd() if isinstance(n.op, ast.And) else ast.BitOr()
+            result = n.values[0]
+            for value in n.values[1:]:
+                result = ast.BinOp(left=result, op=op, right=value)
+            return result
+
+        def visit_IfExp(self, n):
+            self.generic_visit(n)
+            return ast.Call(func=ast.Name(id="where", ctx=ast.Load()), args=[n.test, n.body, n.orelse], keywords=[])
+
+        def visit_UnaryOp(self, n):
+            self.generic_visit(n)
+            if isinstance(n.op, ast.Not):
+                return ast.UnaryOp(op=ast.Invert(), operand=n.operand)
+            return n
+
+    return ast.unparse(ToNumexpr().visit(copy.deepcopy(node)))
+
+
+def _probe_dtype(node, aliases, dtypes, line):
+    """Actual dtype of a validated expression, found by evaluating it on empty columns"""
+    env = {}
+    for name in _names(node):
+        col = aliases.get(name, name)
+        env[col] = pd.Series([], dtype=dtypes[col])
+    try:
+        with np.errstate(all="ignore"):
+            value = _evaluate(node, env, aliases)
+    except (TypeError, ValueError, AttributeError) as e:
+        raise ValueError(f"Could not evaluate '{line}': {e}")
+    dtype = value.dtype if hasattr(value, "dtype") else np.asarray(value).dtype
+    # NumPy text arrays (from where() over string literals) become object columns
+    return np.dtype("object") if dtype.kind in ("U", "S") else dtype
+
+
+def compile_expressions(text, dtypes):
+    """Parse and validate every line of text against a {column: dtype} schema.
+
+    Later lines may use columns defined by earlier ones.
+    """
+    schema = dict(dtypes)
+    compiled = []
+    for line in text.splitlines():
+        if not line.strip() or line.strip().startswith("#"):
+            continue
+        name, tree, aliases = _parse_line(line.strip())
+        columns = _validate(tree, aliases, schema, line.strip())
+        source = _numexpr_source(tree, columns, schema)
+        dtype = _probe_dtype(tree, aliases, schema, line.strip())
+        compiled.append(DerivedColumn(name, line.strip(), tree, tuple(sorted(columns)), source, dtype))
+        schema[name] = dtype
+    return compiled
+
+
+def _evaluate(node, env, aliases):
+    """Vectorised evaluation of a validated tree over pandas Series"""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name):
+        return env[aliases.get(node.id, node.id)]
+    if isinstance(node, ast.BinOp):
+        return _BINOPS[type(node.op)](_evaluate(node.left, env, aliases), _evaluate(node.right, env, aliases))
+    if isinstance(node, ast.UnaryOp):
+        operand = _evaluate(node.operand, env, aliases)
+        if isinstance(node.op, ast.USub):
+            return -operand
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        return ~operand
+    if isinstance(node, ast.Compare):
+        left = _evaluate(node.left, env, aliases)
+        result = None
+        for op, comparator in zip(node.ops, node.comparators):
+            right = _evaluate(comparator, env, aliases)
+            step = _COMPARE[type(op)](left, right)
+            result = step if result is None else result & step
+            left = right
+        return result
+    if isinstance(node, ast.BoolOp):
+        values = [_evaluate(value, env, aliases) for value in node.values]
+        result = values[0]
+        for value in values[1:]:
+            result = (result & value) if isinstance(node.op, ast.And) else (result | value)
+        return result
+    if isinstance(node, ast.IfExp):
+        return np.where(
+            _evaluate(node.test, env, aliases),
+            _evaluate(node.body, env, aliases),
+            _evaluate(node.orelse, env, aliases),
+        )
+    if isinstance(node, ast.Call):
+        args = [_evaluate(arg, env, aliases) for arg in node.args]
+        if isinstance(node.func, ast.Name):
+            return FUNCTIONS[node.func.id](*args)
+        base = pd.Series(_evaluate(node.func.value.value, env, aliases))
+        return getattr(base.str, node.func.attr)(*args)
+    # .dt.<field>
+    base = pd.Series(_evaluate(node.value.value, env, aliases))
+    return getattr(base.dt, node.attr)
+
+
+def _as_array(series):
+    """NumPy view of a column for numexpr, turning missing values into NaN"""
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy()
+    if pd.api.types.is_bool_dtype(series.dtype) and not series.isna().any():
+        return series.to_numpy(dtype=bool)
+    return series.to_numpy(dtype="float64", na_value=np.nan)
+
+
+def evaluate_expressions(df, compiled):
+    """Evaluate a batch of derived columns and add them to df in one assignment"""
+    env = {}
+    arrays = {}
+    results = {}
+    for step in compiled:
+        _, _, aliases = _parse_line(step.source)
+        for col in step.columns:
+            if col not in env:
+                env[col] = results[col] if col in results else df[col]
+        if step.numexpr_source is not None:
+            local_dict = {}
+            for alias_or_name in _names(step.tree):
+                col = aliases.get(alias_or_name, alias_or_name)
+                if col not in arrays:
+                    arrays[col] = _as_array(pd.Series(env[col]))
+                local_dict[alias_or_name] = arrays[col]
+            value = numexpr.evaluate(step.numexpr_source, local_dict=local_dict)
+            # numexpr keeps small integer literals as int32; match the pandas result
+            if (isinstance(step.dtype, np.dtype) and value.dtype != step.dtype
+                    and value.dtype.kind == step.dtype.kind):
+                value = value.astype(step.dtype)
+        else:
+            value = _evaluate(step.tree, env, aliases)
+        if np.ndim(value) == 0:
+            value = np.full(len(df), value)
+        if not isinstance(value, pd.Series):
+            value = pd.Series(value, index=df.index)
+        results[step.name] = value
+        env[step.name] = value
+        arrays.pop(step.name, None)
+    return df.assign(**results)
+
+
+def _names(tree):
+    """Identifiers used as operands (function names excluded)"""
+    functions = {
+        n.func.id for n in ast.walk(tree)
+        if isinstance(n, ast.Call) and isinstance(n.func, ast.Name)
+    }
+    return {n.id for n in ast.walk(tree) if isinstance(n, ast.Name) and n.id not in functions}
+
+
+def apply_expressions(df, text):
+    """Compile text against df's schema and evaluate it"""
+    return evaluate_expressions(df, compile_expressions(text, df.dtypes.items()))
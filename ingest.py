@@ -0,0 +1,96 @@
+import time
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+def excel_engine():
+    """Prefer the Rust calamine reader; fall back to pandas' default engine"""
+    try:
+        import python_calamine  # noqa: F401
+        return "calamine"
+    except ImportError:
+        return None
+
+
+def infer_schema(df):
+    """Shared schema inference for every upload path.
+
+    Integers stay int64: narrower types overflow silently in later arithmetic.
+    Only text columns are read as numbers, and codes with leading zeros stay text.
+    """
+    result = df.copy(deep=False)
+    for col in result.columns:
+        series = result[col]
+        if pd.api.types.infer_dtype(series, skipna=True) == 'string':
+            text = series.dropna().astype(str).str.strip()
+            if not text.str.match(r'[+-]?0\d').any():
+                converted = pd.to_numeric(series, errors='coerce')
+                # Only take the numeric reading when no real values were lost
+                if converted.notna().sum() == series.notna().sum() and converted.notna().any():
+                    series = converted
+        if pd.api.types.is_float_dtype(series.dtype) and not series.isna().any():
+            values = series.to_numpy()
+            # Excel stores every number as a float; bring whole numbers back to int64
+            if (np.isfinite(values).all() and np.array_equal(values, np.floor(values))
+                    and np.abs(values).max(initial=0) < 2 ** 53):
+                series = series.astype('int64')
+        result[col] = series
+    return result
+
+
+@st.cache_data(show_spinner=False)
+def read_csv_file(data):
+    """Parse an uploaded CSV and return (frame, parse seconds)"""
+    start = time.perf_counter()
+    df = infer_schema(pd.read_csv(BytesIO(data)))
+    return df, time.perf_counter() - start
+
+
+@st.cache_data(show_spinner=False)
+def list_excel_sheets(data):
+    """Sheet names of a workbook, without parsing any cells"""
+    return pd.ExcelFile(BytesIO(data), engine=excel_engine()).sheet_names
+
+
+@st.cache_data(show_spinner=False)
+def read_excel_sheets(data, sheets):
+    """Parse only the requested sheets; returns ({sheet: frame}, {sheet: seconds})"""
+    frames, timings = {}, {}
+    with pd.ExcelFile(BytesIO(data), engine=excel_engine()) as workbook:
+        for sheet in sheets:
+            start = time.perf_counter()
+            frames[sheet] = infer_schema(workbook.parse(sheet))
+            timings[sheet] = time.perf_counter() - start
+    return frames, timings
+
+
+def combine_sheets(frames):
+    """Stack several sheets into one frame, tagging rows with their sheet"""
+    if len(frames) == 1:
+        return next(iter(frames.values()))
+    # Never overwrite a real column: suffix the tag until its name is free
+    existing = {col for frame in frames.values() for col in frame.columns}
+    tag, suffix = "sheet", 1
+    while tag in existing:
+        tag, suffix = f"sheet_{suffix}", suffix + 1
+    stacked = pd.concat(
+        [frame.assign(**{tag: name}) for name, frame in frames.items()],
+        ignore_index=True,
+    )
+    return infer_schema(stacked)
+
+
+def timing_report(frames, timings):
+    """Per-sheet parse timing table for the upload page"""
+    return pd.DataFrame([
+        {
+            "Sheet": name,
+            "Rows": frames[name].shape[0],
+            "Columns": frames[name].shape[1],
+            "Parse Time (s)": round(timings[name], 3),
+        }
+        for name in frames
+    ])
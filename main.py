@@ -19,6 +19,14 @@ if "df" not in st.session_state:
     st.session_state.df = None
 if "operation_set" not in st.session_state:
     st.session_state.operation_set = None
+if "derived_steps" not in st.session_state:
+    st.session_state.derived_steps = []
+if "encoders" not in st.session_state:
+    st.session_state.encoders = {}
+if "scalers" not in st.session_state:
+    st.session_state.scalers = {}
+if "backend" not in st.session_state:
+    st.session_state.backend = "pandas"
 
 # Page router
 def main():
@@ -1,8 +1,11 @@
 import pandas as pd
 import streamlit as st
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler, StandardScaler
 from utils import enhanced_sanitize_dataframe_for_streamlit
+from backends import run_on_backend, string_columns
+from encoding import fitted_mappings, label_encode, one_hot_encode
+from scaling import fit_scaler, transform
+from datetime_features import FREQUENCIES, parse_dates, extract_components, datetime_columns, resample_frame
 
 def handle_missing_values(df, method):
     """Handle missing values with Arrow-compatible output"""
@@ -20,13 +23,13 @@ def handle_missing_values(df, method):
 def remove_missing_values(df, method='default', **kwargs):
     """Remove missing values with different strategies"""
     if method == 'default':
-        result = df.dropna()
+        result = run_on_backend(df, 'dropna')
     elif method == 'axis1':
-        result = df.dropna(axis=1)
+        result = run_on_backend(df, 'dropna', axis=1)
     elif method == 'all':
-        result = df.dropna(how='all')
+        result = run_on_backend(df, 'dropna', how='all')
     elif method == 'thresh':
-        result = df.dropna(thresh=kwargs.get('thresh', 2))
+        result = run_on_backend(df, 'dropna', thresh=kwargs.get('thresh', 2))
     else:
         result = df
     
@@ -35,37 +38,25 @@ def remove_missing_values(df, method='default', **kwargs):
 def fill_missing_values(df, method='zero', value=None):
     """Fill missing values with Arrow-compatible types"""
     if method == 'zero':
-        result = df.fillna(0)
-    elif method == 'ffill':
-        result = df.ffill()
-    elif method == 'bfill':
-        result = df.bfill()
-    elif method == 'mean':
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        result = df.copy()
-        for col in numeric_cols:
-            result[col] = result[col].fillna(result[col].mean())
+        result = run_on_backend(df, 'fillna', 0)
+    elif method in ('ffill', 'bfill', 'mean'):
+        result = run_on_backend(df, 'fill_strategy', method)
     elif method == 'unknown':
-        result = df.fillna("Unknown")
+        result = run_on_backend(df, 'fillna', "Unknown")
     else:
         result = df
     
     return enhanced_sanitize_dataframe_for_streamlit(result)
 
 def string_operations(df, operation):
-    """Perform string operations on object columns"""
-    result = df.copy()
-    string_cols = df.select_dtypes(include=['object']).columns
-    
-    if operation == 'lower':
-        for col in string_cols:
-            result[col] = result[col].astype(str).str.lower()
-    elif operation == 'upper':
-        for col in string_cols:
-            result[col] = result[col].astype(str).str.upper()
-    elif operation == 'strip':
-        for col in string_cols:
-            result[col] = result[col].astype(str).str.strip()
+    """Perform string operations on text columns"""
+    result = run_on_backend(df, 'transform_strings', operation)
+    
+    return enhanced_sanitize_dataframe_for_streamlit(result)
+
+def string_transformations(df, feature):
+    """Derive a value per row from every text column"""
+    result = run_on_backend(df, 'string_features', feature)
     
     return enhanced_sanitize_dataframe_for_streamlit(result)
 
@@ -90,8 +81,7 @@ def categorical_operations(df, operation):
     result = df.copy()
     
     if operation == 'to_category':
-        string_cols = result.select_dtypes(include=['object']).columns
-        for col in string_cols:
+        for col in string_columns(result):
             result[col] = result[col].astype('category')
     
     return enhanced_sanitize_dataframe_for_streamlit(result)
@@ -111,21 +101,73 @@ def math_transformations(df, operation):
     
     return enhanced_sanitize_dataframe_for_streamlit(result)
 
-def scaling_operations(df, method):
-    """Apply feature scaling"""
+def scaling_operations(df, method, dtype='float64'):
+    """Apply feature scaling, keeping the fitted parameters for reuse"""
     numeric_df = df.select_dtypes(include=[np.number])
     
     if numeric_df.empty:
         st.warning("No numeric columns found for scaling.")
         return enhanced_sanitize_dataframe_for_streamlit(df)
     
-    if method == 'minmax':
-        scaler = MinMaxScaler()
-    else:  # standardscaler
-        scaler = StandardScaler()
+    params = fit_scaler(df, numeric_df.columns)
+    st.session_state.scalers = {"method": method, "dtype": dtype, "columns": params}
+    result = transform(df, params, method, dtype)
+    
+    return enhanced_sanitize_dataframe_for_streamlit(result)
+
+def reapply_scaling(df):
+    """Scale with the parameters fitted earlier instead of refitting"""
+    scalers = st.session_state.get("scalers")
+    if not scalers:
+        st.warning("No fitted scaling found. Run a scaling operation first.")
+        return enhanced_sanitize_dataframe_for_streamlit(df)
+    
+    missing = [col for col in scalers["columns"] if col not in df.columns]
+    if missing:
+        st.warning(f"Columns not in this dataset were skipped: {', '.join(map(str, missing))}")
+    result = transform(df, scalers["columns"], scalers["method"], scalers["dtype"])
+    
+    return enhanced_sanitize_dataframe_for_streamlit(result)
+
+def encode_categorical(df, method):
+    """Encode categorical columns, reusing any mappings fitted earlier in the session"""
+    columns = string_columns(df) + list(df.select_dtypes(include=['category']).columns)
+    if not columns:
+        st.warning("No categorical columns found for encoding.")
+        return enhanced_sanitize_dataframe_for_streamlit(df)
+    
+    encoders = st.session_state.setdefault("encoders", {})
+    if method == 'label':
+        mappings = fitted_mappings(df, columns, encoders.get('label', {}), max_categories=None)
+        result = label_encode(df, columns, mappings)
+    else:  # onehot
+        mappings = fitted_mappings(df, columns, encoders.get('onehot', {}))
+        result = one_hot_encode(df, columns, mappings)
+    encoders[method] = mappings
+    
+    return enhanced_sanitize_dataframe_for_streamlit(result)
+
+def reset_encoders(df):
+    """Forget fitted encoders so the next run refits on the current data"""
+    st.session_state.encoders = {}
+    return enhanced_sanitize_dataframe_for_streamlit(df)
+
+def datetime_operations(df, operation, freq=None, agg='mean'):
+    """Parse dates, extract calendar features, or resample on the first datetime column"""
+    if operation == 'parse':
+        return enhanced_sanitize_dataframe_for_streamlit(parse_dates(df))
+    
+    if not datetime_columns(df):
+        df = parse_dates(df)
+    time_cols = datetime_columns(df)
+    if not time_cols:
+        st.warning("No datetime columns found. Try 'Parse Dates' first.")
+        return enhanced_sanitize_dataframe_for_streamlit(df)
     
-    scaled_data = scaler.fit_transform(numeric_df)
-    result = pd.DataFrame(scaled_data, columns=numeric_df.columns, index=numeric_df.index)
+    if operation == 'extract':
+        result = extract_components(df, time_cols)
+    else:  # resample
+        result = resample_frame(df, time_cols[0], FREQUENCIES[freq], agg)
     
     return enhanced_sanitize_dataframe_for_streamlit(result)
 
@@ -161,8 +203,8 @@ OP_MAP = {
         "Fill with 'Unknown'": lambda df: fill_missing_values(df, 'unknown'),
     },
     "Removing Duplicates": {
-        "Show Duplicates (.duplicated())": lambda df: enhanced_sanitize_dataframe_for_streamlit(df[df.duplicated()]),
-        "Remove Duplicates (.drop_duplicates())": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.drop_duplicates()),
+        "Show Duplicates (.duplicated())": lambda df: enhanced_sanitize_dataframe_for_streamlit(run_on_backend(df, 'duplicated_rows')),
+        "Remove Duplicates (.drop_duplicates())": lambda df: enhanced_sanitize_dataframe_for_streamlit(run_on_backend(df, 'drop_duplicates')),
     },
     "Renaming Columns": {
         "View Current Column Names": lambda df: enhanced_sanitize_dataframe_for_streamlit(pd.DataFrame(list(df.columns), columns=['Column_Names'])),
@@ -184,7 +226,7 @@ OP_MAP = {
     },
     "Replacing Values": {
         "Replace Zero with NaN": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.replace(0, np.nan)),
-        "Replace Negative with NaN": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.applymap(lambda x: np.nan if (isinstance(x, (int, float)) and x < 0) else x)),
+        "Replace Negative with NaN": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.apply(lambda x: x.mask(x < 0) if pd.api.types.is_numeric_dtype(x) and not pd.api.types.is_bool_dtype(x) else x)),
     },
     "Mathematical Transformations": {
         "Log Transform": lambda df: math_transformations(df, 'log'),
@@ -194,25 +236,32 @@ OP_MAP = {
     "Feature Scaling": {
         "Min-Max Scaling": lambda df: scaling_operations(df, 'minmax'),
         "Standard Scaling (Z-score)": lambda df: scaling_operations(df, 'standard'),
+        "Min-Max Scaling (float32)": lambda df: scaling_operations(df, 'minmax', 'float32'),
+        "Standard Scaling (float32)": lambda df: scaling_operations(df, 'standard', 'float32'),
+        "Reapply Fitted Scaling": reapply_scaling,
     },
     "Encoding Categorical Variables": {
-        "Label Encoding": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.select_dtypes(include=['object', 'category']).apply(lambda x: pd.Categorical(x).codes)),
-        "One-Hot Encoding": lambda df: enhanced_sanitize_dataframe_for_streamlit(pd.get_dummies(df, prefix_sep='_')),
+        "Label Encoding": lambda df: encode_categorical(df, 'label'),
+        "One-Hot Encoding": lambda df: encode_categorical(df, 'onehot'),
+        "Reset Fitted Encoders": reset_encoders,
     },
     "Discretization Binning": {
         "Equal-Width Binning": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.select_dtypes(include=[np.number]).apply(lambda x: pd.cut(x, bins=5, labels=['Very Low', 'Low', 'Medium', 'High', 'Very High']))),
-        "Quantile Binning": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.select_dtypes(include=[np.number]).apply(lambda x: pd.qcut(x, q=4, labels=['Q1', 'Q2', 'Q3', 'Q4']))),
+        "Quantile Binning": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.select_dtypes(include=[np.number]).apply(lambda x: pd.qcut(x.astype('float64').rank(method='first'), q=4, labels=['Q1', 'Q2', 'Q3', 'Q4']))),
     },
     "Column Operations": {
         "Add Row Index": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.reset_index()),
         "Remove Index": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.reset_index(drop=True)),
     },
     "String Transformations": {
-        "Extract String Length": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.select_dtypes(include=['object']).apply(lambda x: x.astype(str).str.len())),
-        "Extract First Character": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.select_dtypes(include=['object']).apply(lambda x: x.astype(str).str[0])),
+        "Extract String Length": lambda df: string_transformations(df, 'length'),
+        "Extract First Character": lambda df: string_transformations(df, 'first_char'),
     },
     "Datetime Transformation": {
-        "Parse Dates": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.select_dtypes(include=['object']).apply(pd.to_datetime, errors='ignore')),
-        "Extract Date Components": lambda df: enhanced_sanitize_dataframe_for_streamlit(df.select_dtypes(include=['datetime64']).apply(lambda x: pd.DataFrame({'year': x.dt.year, 'month': x.dt.month, 'day': x.dt.day}))),
+        "Parse Dates": lambda df: datetime_operations(df, 'parse'),
+        "Extract Date Components": lambda df: datetime_operations(df, 'extract'),
+        "Resample Daily (Mean)": lambda df: datetime_operations(df, 'resample', 'Day', 'mean'),
+        "Resample Monthly (Mean)": lambda df: datetime_operations(df, 'resample', 'Month', 'mean'),
+        "Resample Monthly (Sum)": lambda df: datetime_operations(df, 'resample', 'Month', 'sum'),
     }
 }
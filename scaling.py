@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+
+CHUNK_SIZE = 262_144  # rows per streaming chunk
+
+
+def chunk_stats(values):
+    """Count/mean/M2/min/max of one float chunk, ignoring NaN"""
+    count = int(np.count_nonzero(~np.isnan(values)))
+    if count == 0:
+        return {"count": 0, "mean": 0.0, "m2": 0.0, "min": np.inf, "max": -np.inf}
+    mean = float(np.nanmean(values))
+    return {
+        "count": count,
+        "mean": mean,
+        "m2": float(np.nansum((values - mean) ** 2)),
+        "min": float(np.nanmin(values)),
+        "max": float(np.nanmax(values)),
+    }
+
+
+def merge_stats(a, b):
+    """Combine two partial results (Chan et al.), so chunks can be fitted independently"""
+    if a["count"] == 0:
+        return dict(b)
+    if b["count"] == 0:
+        return dict(a)
+    count = a["count"] + b["count"]
+    delta = b["mean"] - a["mean"]
+    return {
+        "count": count,
+        "mean": a["mean"] + delta * b["count"] / count,
+        "m2": a["m2"] + b["m2"] + delta * delta * a["count"] * b["count"] / count,
+        "min": min(a["min"], b["min"]),
+        "max": max(a["max"], b["max"]),
+    }
+
+
+def _column_values(series):
+    """Column as a NumPy array without copying when it is already NumPy-backed"""
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy()
+    return series.to_numpy(dtype="float64", na_value=np.nan)
+
+
+def fit_column(series, chunk_size=CHUNK_SIZE):
+    """Statistics of one column in a single streaming pass over row chunks"""
+    values = _column_values(series)
+    stats = chunk_stats(np.empty(0))
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size].astype("float64", copy=False)
+        stats = merge_stats(stats, chunk_stats(chunk))
+    return stats
+
+
+def fit_scaler(df, columns, chunk_size=CHUNK_SIZE):
+    """{column: stats} for every column; the stats serve both min-max and z-score"""
+    return {col: fit_column(df[col], chunk_size) for col in columns}
+
+
+def _scale_and_shift(stats, method):
+    if method == 'minmax':
+        span = stats["max"] - stats["min"]
+        # Constant columns map to 0, as sklearn does
+        return stats["min"], span if np.isfinite(span) and span != 0 else 1.0
+    std = np.sqrt(stats["m2"] / stats["count"]) if stats["count"] else 0.0
+    return stats["mean"], std if std != 0 else 1.0
+
+
+def transform_column(series, stats, method, dtype="float64"):
+    """Scale one column into a single output buffer, modified in place"""
+    out = series.to_numpy(dtype=dtype, na_value=np.nan, copy=True)
+    shift, scale = _scale_and_shift(stats, method)
+    np.subtract(out, out.dtype.type(shift), out=out)
+    np.divide(out, out.dtype.type(scale), out=out)
+    return out
+
+
+def transform(df, params, method, dtype="float64"):
+    """Apply fitted parameters column by column; only one column is in flight at a time"""
+    return pd.DataFrame(
+        {col: transform_column(df[col], stats, method, dtype) for col, stats in params.items() if col in df.columns},
+        index=df.index,
+    )
+
+
+def scaler_summary(scalers):
+    """One row per fitted column, for display"""
+    rows = []
+    for col, stats in scalers.get("columns", {}).items():
+        shift, scale = _scale_and_shift(stats, scalers["method"])
+        rows.append({
+            "Column": col,
+            "Method": scalers["method"],
+            "Dtype": scalers["dtype"],
+            "Count": stats["count"],
+            "Shift": shift,
+            "Scale": scale,
+        })
+    return pd.DataFrame(rows, columns=["Column", "Method", "Dtype", "Count", "Shift", "Scale"])
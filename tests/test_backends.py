@@ -0,0 +1,125 @@
+import pytest
+
+pytest.importorskip("streamlit")
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+import backends  # noqa: E402
+from backends import BACKENDS, DEFAULT_BACKEND, available_backends  # noqa: E402
+from operations import CLEANING_OPS, OP_MAP, TRANSFORM_OPS  # noqa: E402
+
+# Operations routed through the backend; their values must match plain pandas.
+# The rest run in pandas on whatever frame the backend produced, so they may show
+# that backend's own dtypes; they are only required to run.
+BACKEND_OPS = [
+    "Removing Missing Values", "Filling Missing Values", "Removing Duplicates",
+    "String Cleaning", "String Transformations",
+]
+
+OPERATION_CASES = [(group, label) for group in CLEANING_OPS + TRANSFORM_OPS for label in OP_MAP[group]]
+
+
+def sample_frame():
+    return pd.DataFrame({
+        "count": [1, 2, 3, 1, 5, 6],
+        "amount": [1.5, np.nan, 2.0, 1.5, np.nan, np.nan],
+        "city": [" Paris", "berlin ", None, " Paris", "Rome", None],
+    }, index=[10, 11, 12, 13, 14, 15])
+
+
+def backend_input(name):
+    """The frame OP_MAP sees for a backend, as prepared by the upload page"""
+    df = sample_frame()
+    if name != DEFAULT_BACKEND:
+        df = BACKENDS["pandas-arrow"]().from_pandas(df)
+    return df
+
+
+def normalize(df):
+    """Backend-neutral view: index, columns, and cells as float/str/None.
+
+    Missing text is '' under the NumPy pandas backend and a real null under the
+    Arrow-backed ones; both normalize to None.
+    """
+    def cell(value):
+        if value is None or value is pd.NA or (isinstance(value, float) and np.isnan(value)) or value == "":
+            return None
+        if isinstance(value, (bool, np.bool_)):
+            return bool(value)
+        if isinstance(value, (int, float, np.number)):
+            return float(value)
+        return str(value)
+
+    return (
+        list(df.index),
+        [str(col) for col in df.columns],
+        [[cell(value) for value in row] for row in df.astype(object).itertuples(index=False)],
+    )
+
+
+def run_op(monkeypatch, name, group, label):
+    monkeypatch.setattr(backends, "get_backend", lambda backend=None: BACKENDS[backend or name]())
+    return OP_MAP[group][label](backend_input(name))
+
+
+@pytest.mark.parametrize("name", available_backends())
+@pytest.mark.parametrize("group,label", OPERATION_CASES)
+def test_operation_runs(monkeypatch, name, group, label):
+    result = run_op(monkeypatch, name, group, label)
+    assert isinstance(result, pd.DataFrame)
+
+
+@pytest.mark.parametrize("name", [name for name in available_backends() if name != DEFAULT_BACKEND])
+@pytest.mark.parametrize("group,label", [case for case in OPERATION_CASES if case[0] in BACKEND_OPS])
+def test_backend_matches_pandas(monkeypatch, name, group, label):
+    expected = run_op(monkeypatch, DEFAULT_BACKEND, group, label)
+    result = run_op(monkeypatch, name, group, label)
+    assert normalize(result) == normalize(expected)
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_fill_mean_keeps_complete_int_columns_integer(monkeypatch, name):
+    result = run_op(monkeypatch, name, "Filling Missing Values", "Fill with Mean")
+    assert pd.api.types.is_integer_dtype(result["count"])
+    assert result["amount"].tolist() == pytest.approx([1.5, 5 / 3, 2.0, 1.5, 5 / 3, 5 / 3])
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_fill_unknown_leaves_numeric_columns_alone(monkeypatch, name):
+    result = run_op(monkeypatch, name, "Filling Missing Values", "Fill with 'Unknown'")
+    assert pd.api.types.is_numeric_dtype(result["amount"])
+    assert result["amount"].isna().sum() == 3
+    assert result["city"].tolist()[2] == "Unknown"
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_string_transformations_keep_missing_text_missing(monkeypatch, name):
+    lengths = run_op(monkeypatch, name, "String Transformations", "Extract String Length")
+    first = run_op(monkeypatch, name, "String Transformations", "Extract First Character")
+    assert lengths.columns.tolist() == first.columns.tolist() == ["city"]
+    assert lengths["city"].tolist()[:2] == [6, 7]
+    assert first["city"].tolist()[:2] == [" ", "b"]
+    assert not {"<NA>", "N", "n"} & set(first["city"].dropna().tolist())
+    assert lengths["city"].dropna().tolist() in ([6, 7, 6, 4], [6, 7, 0, 6, 4, 0])
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_row_labels_survive(monkeypatch, name):
+    duplicates = run_op(monkeypatch, name, "Removing Duplicates", "Show Duplicates (.duplicated())")
+    assert list(duplicates.index) == [13]
+    dropped = run_op(monkeypatch, name, "Removing Missing Values", "Drop if <2 Values (.dropna(thresh=2))")
+    assert list(dropped.index) == [10, 11, 12, 13, 14]
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_sparse_one_hot_output_feeds_backends(monkeypatch, name):
+    from encoding import indicator_block
+    codes = np.arange(6) % 3
+    wide = indicator_block(codes, [f"cat_{i}" for i in range(40)], sample_frame().index)
+    df = pd.concat([sample_frame(), wide], axis=1)
+    monkeypatch.setattr(backends, "get_backend", lambda backend=None: BACKENDS[name]())
+    filled = OP_MAP["Filling Missing Values"]["Fill with 0 (.fillna(0))"](df)
+    deduped = OP_MAP["Removing Duplicates"]["Remove Duplicates (.drop_duplicates())"](df)
+    assert filled["cat_1"].astype(bool).tolist() == [False, True, False, False, True, False]
+    assert list(deduped.index) == [10, 11, 12, 14, 15]
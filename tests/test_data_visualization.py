@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("plotly")
+
+import pandas as pd  # noqa: E402
+
+from data_visualization import create_chart  # noqa: E402
+
+
+def events_frame():
+    return pd.DataFrame({
+        "when": pd.to_datetime(["2024-01-05", "2024-01-20", "2024-02-03"]),
+        "amount": [1.0, 3.0, 5.0],
+        "city": ["Paris", "Rome", "Paris"],
+    })
+
+
+def test_text_y_is_counted_per_bucket():
+    fig = create_chart(events_frame(), "Line", {"x": "when", "y": "city", "time_bucket": "Month", "time_agg": "mean"})
+    assert list(fig.data[0].y) == [2, 1]
+
+
+def test_scatter_sized_by_its_y_column():
+    params = {"x": "when", "y": "amount", "size": "amount", "time_bucket": "Month", "time_agg": "sum"}
+    fig = create_chart(events_frame(), "Scatter", params)
+    assert list(fig.data[0].y) == [4.0, 5.0]
@@ -0,0 +1,52 @@
+import pytest
+
+pytest.importorskip("streamlit")
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from datetime_features import extract_components, resample_frame  # noqa: E402
+
+
+@pytest.mark.parametrize("unit", ["ns", "us", "ms", "s"])
+def test_epoch_seconds_do_not_depend_on_resolution(unit):
+    stamps = pd.Series(pd.to_datetime(["2024-01-01 07:20:00", "2024-03-15 12:00:00"])).astype(f"datetime64[{unit}]")
+    result = extract_components(pd.DataFrame({"when": stamps}))
+    assert result["when_epoch"].tolist() == [1704093600, 1710504000]
+    assert result["when_year"].dtype == np.int16
+    assert result["when_month"].tolist() == [1, 3]
+
+
+def test_missing_timestamps_fall_back_to_float():
+    stamps = pd.Series(pd.to_datetime(["2024-01-01", None]))
+    result = extract_components(pd.DataFrame({"when": stamps}))
+    assert result["when_epoch"].iloc[0] == 1704067200
+    assert np.isnan(result["when_epoch"].iloc[1])
+    assert result["when_day"].dtype == np.float32
+
+
+def test_tz_aware_epoch_counts_from_the_utc_instant():
+    stamps = pd.Series(pd.to_datetime(["2024-01-01T00:00Z"])).dt.tz_convert("America/New_York")
+    result = extract_components(pd.DataFrame({"when": stamps}))
+    assert result["when_epoch"].tolist() == [1704067200]
+    assert result["when_day"].tolist() == [31]
+
+
+def sales_frame():
+    return pd.DataFrame({
+        "when": pd.to_datetime(["2024-01-05", "2024-01-20", "2024-02-03", "2024-02-04"]),
+        "amount": [1.0, 3.0, 5.0, 7.0],
+        "city": ["Paris", "Rome", "Paris", "Paris"],
+    })
+
+
+def test_resample_frame_aggregates_per_bucket_and_group():
+    result = resample_frame(sales_frame(), "when", "MS", "sum", by=["city"])
+    assert result.columns.tolist() == ["when", "city", "amount"]
+    assert result["amount"].tolist() == [1.0, 3.0, 12.0]
+
+
+def test_resample_frame_ignores_repeated_value_columns():
+    result = resample_frame(sales_frame(), "when", "MS", "mean", value_cols=["amount", "amount"])
+    assert result.columns.tolist() == ["when", "amount"]
+    assert result["amount"].tolist() == [2.0, 6.0]
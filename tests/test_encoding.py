@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("streamlit")
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from encoding import category_codes, fit_category_mapping, indicator_block  # noqa: E402
+from utils import enhanced_sanitize_dataframe_for_streamlit  # noqa: E402
+
+
+def test_sanitizer_keeps_categoricals_so_label_codes_are_reused():
+    df = pd.DataFrame({"city": pd.Categorical(["b", "a", "b", None])})
+    clean = enhanced_sanitize_dataframe_for_streamlit(df)
+    assert isinstance(clean["city"].dtype, pd.CategoricalDtype)
+
+    mapping = fit_category_mapping(clean["city"], max_categories=None)
+    codes = category_codes(clean["city"], mapping)
+    assert codes.tolist() == clean["city"].cat.codes.tolist() == [1, 0, 1, -1]
+
+
+def test_rare_values_share_the_other_bucket():
+    series = pd.Series(["a"] * 5 + ["b"] * 3 + ["c", "d"])
+    mapping = fit_category_mapping(series, max_categories=2)
+    assert mapping["categories"] == ["a", "b"] and mapping["other"]
+    assert category_codes(series, mapping).tolist() == [0] * 5 + [1] * 3 + [2, 2]
+
+
+def test_unseen_values_code_as_missing_without_warnings(recwarn):
+    mapping = fit_category_mapping(pd.Series(["a", "b", "a"]), max_categories=None)
+    codes = category_codes(pd.Series(["b", "z", None, "a"]), mapping)
+    assert codes.tolist() == [1, -1, -1, 0]
+    assert codes.dtype == np.int8
+    assert not recwarn.list
+
+
+def test_wide_blocks_are_sparse_bool_with_false_fill(recwarn):
+    codes = np.array([0, 39, -1, 5])
+    block = indicator_block(codes, [f"c_{i}" for i in range(40)], pd.RangeIndex(4))
+    assert (block.dtypes == pd.SparseDtype(bool, False)).all()
+    assert block["c_39"].tolist() == [False, True, False, False]
+    assert not recwarn.list
@@ -0,0 +1,89 @@
+import pytest
+
+pytest.importorskip("pandas")
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+import expressions  # noqa: E402
+from expressions import apply_expressions, compile_expressions  # noqa: E402
+
+EXPRESSIONS = [
+    "c = a + b * 2",
+    "c = a - x",
+    "c = a / b",
+    "c = a // b",
+    "c = a % b",
+    "c = a ** 2",
+    "c = -a",
+    "c = a & b",
+    "c = a | b",
+    "c = ~a",
+    "c = a > b",
+    "c = 0 < a <= 3",
+    "c = a > 0 and b > 0",
+    "c = a > 0 or flag",
+    "c = not flag",
+    "c = a if flag else b",
+    "c = where(a > 0, x, 0)",
+    "c = where(a > 0, 1, 0)",
+    "c = abs(a) + sqrt(b)",
+    "c = log(b + 1)",
+    "c = `unit price` * 3",
+    "c = s.str.upper()",
+    "c = s.str.len()",
+    "c = s.str.contains('a')",
+    "c = when.dt.month",
+    "c = a * 2\nd = c + x",
+    "c = s\nd = c.str.upper()",
+    "c = s\nd = c * 2",
+]
+
+
+def sample_frame():
+    return pd.DataFrame({
+        "a": [-7, 2, 3, 0],
+        "b": [3, 0, 2, 5],
+        "x": [0.5, -1.5, np.nan, 4.0],
+        "flag": [True, False, True, False],
+        "unit price": [1.25, 2.0, 0.5, 3.0],
+        "s": ["ab", " Cd", "ef ", "gh"],
+        "when": pd.to_datetime(["2024-01-05", "2024-02-10", "2024-03-15", "2024-04-20"]),
+    })
+
+
+@pytest.mark.parametrize("text", EXPRESSIONS)
+def test_numexpr_and_pandas_agree(monkeypatch, text):
+    pytest.importorskip("numexpr")
+    accelerated = apply_expressions(sample_frame(), text)
+    monkeypatch.setattr(expressions, "numexpr", None)
+    plain = apply_expressions(sample_frame(), text)
+    pd.testing.assert_frame_equal(accelerated, plain)
+
+
+def test_numeric_lines_go_through_numexpr():
+    pytest.importorskip("numexpr")
+    [step] = compile_expressions("c = a + b * 2", sample_frame().dtypes.items())
+    assert step.numexpr_source is not None
+
+
+@pytest.mark.parametrize("text", ["c = not a", "c = a and b", "c = flag or b"])
+def test_boolean_keywords_need_boolean_operands(text):
+    with pytest.raises(ValueError, match="true/false"):
+        apply_expressions(sample_frame(), text)
+
+
+def test_modulo_by_zero_is_missing():
+    result = apply_expressions(sample_frame(), "c = a % b")
+    assert result["c"].isna().tolist() == [False, True, False, False]
+
+
+def test_derived_columns_keep_their_real_dtype():
+    result = apply_expressions(sample_frame(), "c = s\nd = c.str.upper()\ne = c * 2")
+    assert result["d"].tolist() == ["AB", " CD", "EF ", "GH"]
+    assert result["e"].tolist() == ["abab", " Cd Cd", "ef ef ", "ghgh"]
+
+
+def test_text_accessor_on_numbers_is_rejected():
+    with pytest.raises(ValueError, match="text column"):
+        apply_expressions(sample_frame(), "c = a * 2\nd = c.str.upper()")
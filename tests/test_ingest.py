@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("streamlit")
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from ingest import combine_sheets, infer_schema, read_csv_file  # noqa: E402
+
+
+def test_numeric_text_becomes_numbers():
+    df = pd.DataFrame({"n": ["1", "2", None], "x": ["1.5", " 2", "3"]}, dtype=object)
+    result = infer_schema(df)
+    assert result["n"].dtype == np.float64
+    assert result["x"].tolist() == [1.5, 2.0, 3.0]
+
+
+def test_whole_floats_come_back_as_int64():
+    result = infer_schema(pd.DataFrame({"n": [1.0, 2.0, 3.0], "x": [1.0, np.nan, 2.0]}))
+    assert result["n"].dtype == np.int64
+    assert result["x"].dtype == np.float64
+
+
+def test_leading_zero_codes_stay_text():
+    result = infer_schema(pd.DataFrame({"zip": ["00123", "10115", "0042"]}, dtype=object))
+    assert result["zip"].tolist() == ["00123", "10115", "0042"]
+
+
+def test_bools_with_blanks_are_not_read_as_numbers():
+    df, _ = read_csv_file(b"f,g\nTrue,1\n,2\nFalse,3\n")
+    assert not pd.api.types.is_float_dtype(df["f"])
+    assert df["f"].tolist()[::2] == [True, False]
+    assert df["g"].dtype == np.int64
+
+
+def test_combine_sheets_keeps_bool_columns_and_tags_rows():
+    frames = {
+        "a": pd.DataFrame({"flag": [True, False], "n": [1, 2]}),
+        "b": pd.DataFrame({"n": [3]}),
+    }
+    result = combine_sheets(frames)
+    assert not pd.api.types.is_float_dtype(result["flag"])
+    assert result["flag"].tolist()[:2] == [True, False]
+    assert result["sheet"].tolist() == ["a", "a", "b"]
+    assert result["n"].dtype == np.int64
+
+
+def test_combine_sheets_does_not_overwrite_a_sheet_column():
+    frames = {
+        "a": pd.DataFrame({"sheet": ["x"]}),
+        "b": pd.DataFrame({"sheet": ["y"]}),
+    }
+    result = combine_sheets(frames)
+    assert result["sheet"].tolist() == ["x", "y"]
+    assert result["sheet_1"].tolist() == ["a", "b"]
@@ -0,0 +1,54 @@
+import pytest
+
+pytest.importorskip("pandas")
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from scaling import chunk_stats, fit_column, fit_scaler, merge_stats, transform  # noqa: E402
+
+
+def sample_frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "x": rng.normal(50, 12, 1000),
+        "n": rng.integers(-5, 500, 1000),
+        "c": np.full(1000, 3.0),
+    })
+
+
+@pytest.mark.parametrize("method,dtype,tolerance", [
+    ("standard", "float64", 1e-12),
+    ("minmax", "float64", 1e-12),
+    ("standard", "float32", 1e-6),
+    ("minmax", "float32", 1e-6),
+])
+def test_matches_sklearn(method, dtype, tolerance):
+    preprocessing = pytest.importorskip("sklearn.preprocessing")
+    df = sample_frame()
+    scaler = preprocessing.StandardScaler() if method == "standard" else preprocessing.MinMaxScaler()
+    expected = scaler.fit_transform(df.to_numpy(dtype="float64"))
+    result = transform(df, fit_scaler(df, df.columns, chunk_size=128), method, dtype)
+    assert result.dtypes.unique().tolist() == [np.dtype(dtype)]
+    assert np.abs(result.to_numpy(dtype="float64") - expected).max() < tolerance
+
+
+def test_merged_chunks_equal_a_single_pass():
+    values = sample_frame()["x"].to_numpy()
+    single = chunk_stats(values)
+    merged = chunk_stats(np.empty(0))
+    for chunk in np.array_split(values, 7):
+        merged = merge_stats(merged, chunk_stats(chunk))
+    assert merged["count"] == single["count"]
+    assert merged["min"] == single["min"] and merged["max"] == single["max"]
+    assert merged["mean"] == pytest.approx(single["mean"], rel=1e-12)
+    assert merged["m2"] == pytest.approx(single["m2"], rel=1e-12)
+
+
+def test_missing_values_are_skipped_and_kept():
+    series = pd.Series([1.0, np.nan, 3.0])
+    stats = fit_column(series, chunk_size=2)
+    assert stats["count"] == 2 and stats["mean"] == 2.0
+    result = transform(pd.DataFrame({"v": series}), {"v": stats}, "minmax")
+    assert result["v"].tolist()[::2] == [0.0, 1.0]
+    assert np.isnan(result["v"].iloc[1])
@@ -1,17 +1,61 @@
 import streamlit as st
-import pandas as pd
-from utils import back_button, next_button, nav, enhanced_sanitize_dataframe_for_streamlit, safe_display_dataframe
+from utils import back_button, next_button, nav, enhanced_sanitize_dataframe_for_streamlit, safe_display_dataframe, load_fitted_params
+from backends import BACKENDS, DEFAULT_BACKEND, available_backends, get_backend
+from ingest import read_csv_file, list_excel_sheets, read_excel_sheets, combine_sheets, timing_report
+
+def load_excel(data):
+    """Let the user pick sheets, then parse only those"""
+    sheet_names = list_excel_sheets(data)
+    mode = "Single sheet"
+    if len(sheet_names) > 1:
+        mode = st.radio("Sheets", ["Single sheet", "Combine sheets"], horizontal=True, key="sheet_mode")
+    if mode == "Single sheet":
+        selected = [st.selectbox("Sheet to load", sheet_names, key="sheet_single")]
+    else:
+        selected = st.multiselect("Sheets to combine", sheet_names, default=sheet_names, key="sheet_multi")
+    if not selected:
+        st.info("Select at least one sheet to load.")
+        return None
+    frames, timings = read_excel_sheets(data, tuple(selected))
+    with st.expander("Sheet parse timing"):
+        safe_display_dataframe(timing_report(frames, timings))
+    return combine_sheets(frames)
 
 def upload_page():
     back_button("home")
     st.title("Upload your dataset")
+    backend_names = available_backends()
+    current = st.session_state.get("backend", DEFAULT_BACKEND)
+    st.session_state.backend = st.selectbox(
+        "Dataframe backend",
+        backend_names,
+        index=backend_names.index(current) if current in backend_names else 0,
+        format_func=lambda name: BACKENDS[name].label,
+        key="backend_select",
+    )
+    with st.expander("Reuse fitted parameters (optional)"):
+        params_file = st.file_uploader("Fitted parameters JSON from a previous export", type=["json"], key="params_upload")
+        if params_file:
+            try:
+                load_fitted_params(params_file.getvalue())
+                st.success("Fitted parameters loaded; encoders and scalers will reuse them.")
+            except Exception as e:
+                st.error(f"Error loading parameters: {str(e)}")
     uploaded = st.file_uploader("Choose your dataset", type=["csv", "xlsx"])
     if uploaded:
         try:
             if uploaded.name.endswith(".csv"):
-                df = pd.read_csv(uploaded)
+                df, parse_time = read_csv_file(uploaded.getvalue())
+                st.caption(f"Parsed in {parse_time:.3f}s")
             else:
-                df = pd.read_excel(uploaded)
+                df = load_excel(uploaded.getvalue())
+            if df is None:
+                next_button("Next", "cleaning_menu", disabled=st.session_state.df is None)
+                return
+            backend = get_backend()
+            if backend.name != DEFAULT_BACKEND:
+                # Arrow-backed frames keep native strings/nulls for every backend but plain pandas
+                df = get_backend("pandas-arrow").from_pandas(df)
             df = enhanced_sanitize_dataframe_for_streamlit(df)
             st.session_state.df = df.copy()
             st.success(f"Dataset loaded successfully! Shape: {df.shape}")
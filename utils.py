@@ -60,12 +60,18 @@ def enhanced_sanitize_dataframe_for_streamlit(df):
     if df is None or df.empty:
         return df
     
-    df_clean = df.copy()
+    # Shallow copy: columns are only ever replaced below, never written in place
+    df_clean = df.copy(deep=False)
     
     # Handle each column individually with comprehensive type checking
     for col in df_clean.columns:
         col_dtype = str(df_clean[col].dtype)
         
+        # Arrow-backed columns already convert to Arrow without a copy;
+        # sparse indicators are densified only for display
+        if isinstance(df_clean[col].dtype, (pd.ArrowDtype, pd.SparseDtype)):
+            continue
+        
         # Handle nullable integer types (Int64, Int32, etc.)
         if col_dtype.startswith('Int') or 'Int' in col_dtype:
             try:
@@ -99,15 +105,19 @@ def enhanced_sanitize_dataframe_for_streamlit(df):
             except:
                 df_clean[col] = df_clean[col].astype(str)
         
-        # Handle category types
+        # Category types become Arrow dictionary arrays as they are; only
+        # mixed-type categories, which Arrow can't type, are flattened to text
         elif col_dtype == 'category':
             try:
-                df_clean[col] = df_clean[col].astype(str)
+                if df_clean[col].cat.categories.inferred_type.startswith('mixed'):
+                    df_clean[col] = df_clean[col].astype(str)
             except:
                 df_clean[col] = 'Category'
     
     # Final safety check - ensure no problematic dtypes remain
     for col in df_clean.columns:
+        if isinstance(df_clean[col].dtype, (pd.ArrowDtype, pd.SparseDtype)):
+            continue
         dtype_str = str(df_clean[col].dtype)
         if (dtype_str.startswith('Int') or 
             dtype_str == 'boolean' or 
@@ -120,6 +130,11 @@ def safe_display_dataframe(df, key=None, **kwargs):
     """Safely display DataFrame in Streamlit with enhanced error handling"""
     try:
         clean_df = enhanced_sanitize_dataframe_for_streamlit(df)
+        sparse_cols = [col for col, dtype in clean_df.dtypes.items() if isinstance(dtype, pd.SparseDtype)]
+        if sparse_cols:
+            clean_df = clean_df.copy(deep=False)
+            for col in sparse_cols:
+                clean_df[col] = clean_df[col].sparse.to_dense()
         st.dataframe(clean_df, key=key, **kwargs)
     except Exception as e:
         st.error(f"Error displaying data: {str(e)}")
@@ -133,6 +148,22 @@ def safe_display_dataframe(df, key=None, **kwargs):
             st.write("Data preview (text format):")
             st.text(str(df.head()))
 
+FITTED_STATE_KEYS = ["encoders", "scalers"]
+
+def fitted_params_json():
+    """Serialize everything fitted this session so another session can reuse it"""
+    import json
+    params = {key: st.session_state.get(key) or {} for key in FITTED_STATE_KEYS}
+    return json.dumps(params, indent=2, default=str).encode('utf-8')
+
+def load_fitted_params(data):
+    """Restore fitted encoders and scalers from fitted_params_json() output"""
+    import json
+    params = json.loads(data)
+    for key in FITTED_STATE_KEYS:
+        if key in params:
+            st.session_state[key] = params[key]
+
 def safe_excel_export(df, filename="processed_dataset.xlsx"):
     """
     Safely export DataFrame to Excel with fallback options.